@@ -0,0 +1,72 @@
+"""
+Cold Start Benchmark for Portfolio
+Measures import-to-first-byte time of a fresh process, with and without the
+startup warm-up (portfolio/warmup.py). Each run uses a new process and an empty
+page cache, like a free-tier instance spinning back up.
+
+Usage:
+    python benchmarks/cold_start.py [path] [runs]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# Runs inside the child process: time importing the WSGI app until /readyz
+# would report ready (the warm-up runs in a background thread), then the
+# first request until its first body chunk is produced.
+CHILD = r"""
+import sys, time
+started = time.perf_counter()
+sys.path.insert(0, sys.argv[2])
+import core.wsgi
+from portfolio import warmup
+while not warmup.is_ready():
+    time.sleep(0.001)
+imported = time.perf_counter()
+
+from wsgiref.util import setup_testing_defaults
+environ = {'PATH_INFO': sys.argv[1], 'HTTP_HOST': '127.0.0.1', 'SERVER_NAME': '127.0.0.1'}
+setup_testing_defaults(environ)
+status = []
+body = iter(core.wsgi.application(environ, lambda s, h, e=None: status.append(s)))
+next(body)
+first_byte = time.perf_counter()
+print(status[0].split()[0], imported - started, first_byte - imported, first_byte - started)
+"""
+
+
+def run_once(path, warmup):
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = dict(os.environ, CACHE_DIR=cache_dir, PORTFOLIO_WARMUP='1' if warmup else '0')
+        env.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+        output = subprocess.run(
+            [sys.executable, '-c', CHILD, path, str(BASE_DIR)],
+            env=env, cwd=BASE_DIR, capture_output=True, text=True, check=True,
+        ).stdout.split()
+    status, import_time, request_time, total = output[0], *map(float, output[1:])
+    return status, import_time, request_time, total
+
+
+def report(label, results):
+    def median_ms(index):
+        return statistics.median(r[index] for r in results) * 1000
+
+    print(f"{label:<16} import to ready {median_ms(1):8.1f} ms   first request {median_ms(2):8.1f} ms   "
+          f"import-to-first-byte {median_ms(3):8.1f} ms   (status {results[0][0]})")
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else '/'
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    print("=" * 60)
+    print(f"Cold start: GET {path}, median of {runs} fresh processes")
+    print("=" * 60)
+    report("without warm-up", [run_once(path, warmup=False) for _ in range(runs)])
+    report("with warm-up", [run_once(path, warmup=True) for _ in range(runs)])
@@ -0,0 +1,130 @@
+"""
+Load Test for Portfolio
+Starts gunicorn with gunicorn.conf.py once per worker class and hammers one
+path from a pool of client threads, wrk style, reporting throughput and
+latency percentiles. Worker classes whose package isn't installed (gevent)
+are skipped.
+
+Usage:
+    python benchmarks/load_test.py [path] [seconds] [connections]
+"""
+
+import http.client
+import importlib.util
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# (label, worker class, threads per worker, required module)
+WORKER_CLASSES = [
+    ('sync', 'sync', 1, None),
+    ('gthread', 'gthread', 4, None),
+    ('gevent', 'gevent', 1, 'gevent'),
+]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_ready(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+            conn.request('GET', '/readyz', headers={'Host': '127.0.0.1'})
+            if conn.getresponse().status == 200:
+                return True
+        except OSError:
+            pass
+        time.sleep(0.2)
+    return False
+
+
+def hammer(port, path, seconds, connections):
+    """Run client threads for the given time; return (requests, errors, latencies)."""
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.monotonic() + seconds
+
+    def client():
+        local = []
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            try:
+                conn.request('GET', path, headers={'Host': '127.0.0.1'})
+                response = conn.getresponse()
+                response.read()
+                if response.status != 200:
+                    raise OSError(response.status)
+                if response.getheader('Connection', '').lower() == 'close':
+                    conn.close()
+                local.append(time.perf_counter() - started)
+            except (OSError, http.client.HTTPException):
+                with lock:
+                    errors[0] += 1
+                conn.close()
+                conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=client) for _ in range(connections)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return len(latencies), errors[0], latencies
+
+
+def run(label, worker_class, threads, path, seconds, connections):
+    port = free_port()
+    env = dict(os.environ, PORT=str(port), GUNICORN_WORKER_CLASS=worker_class, GUNICORN_THREADS=str(threads))
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', 'core.wsgi', '-c', 'gunicorn.conf.py'],
+        cwd=BASE_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        if not wait_until_ready(port):
+            print(f"{label:<10} server did not become ready")
+            return
+        hammer(port, path, 1, connections)  # let every worker touch its caches
+        requests, errors, latencies = hammer(port, path, seconds, connections)
+    finally:
+        server.terminate()
+        server.wait()
+
+    if not latencies:
+        print(f"{label:<10} no successful requests ({errors} errors)")
+        return
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(f"{label:<10}{requests / seconds:>10.1f}{p50:>10.1f}{p99:>10.1f}{errors:>8}")
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else '/'
+    seconds = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    connections = int(sys.argv[3]) if len(sys.argv) > 3 else 16
+
+    print("=" * 60)
+    print(f"GET {path} for {seconds}s over {connections} connections "
+          f"(workers: {os.environ.get('WEB_CONCURRENCY', 'auto')})")
+    print("=" * 60)
+    print(f"{'class':<10}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for label, worker_class, threads, module in WORKER_CLASSES:
+        if module and importlib.util.find_spec(module) is None:
+            print(f"{label:<10} skipped ({module} not installed)")
+            continue
+        run(label, worker_class, threads, path, seconds, connections)
@@ -0,0 +1,100 @@
+"""
+Template Render Benchmark for Portfolio
+Compares the per-request template cost under the original TEMPLATES setting
+(APP_DIRS, no explicit loaders) against the one in core/settings.py. Since
+Django 4.1 the default loaders are wrapped in the cached loader whatever
+DEBUG is, so both engines are expected to resolve to the same loader chain;
+the benchmark prints each chain before timing it.
+
+Usage:
+    python benchmarks/template_render.py [iterations]
+"""
+
+import os
+import sys
+import time
+from copy import deepcopy
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.template.backends.django import DjangoTemplates  # noqa: E402
+
+from portfolio import views  # noqa: E402
+
+PAGES = [
+    ('portfolio/home.html', views.home_context),
+    ('portfolio/projects.html', views.projects_context),
+    ('portfolio/gallery.html', views.gallery_context),
+    ('portfolio/about.html', views.about_context),
+]
+
+
+def make_backend(name):
+    params = deepcopy(settings.TEMPLATES[0])
+    params['NAME'] = name
+    params.pop('BACKEND')
+    params.setdefault('APP_DIRS', False)
+    if name == 'baseline':
+        # TEMPLATES as the project shipped it, before loaders were listed
+        params['APP_DIRS'] = True
+        params['OPTIONS'].pop('loaders', None)
+    return DjangoTemplates(params)
+
+
+def describe_loaders(backend):
+    """Loader chain by module name, e.g. 'cached(filesystem, app_directories)'."""
+    def name(loader):
+        return type(loader).__module__.rsplit('.', 1)[-1]
+
+    return ', '.join(
+        f"{name(loader)}({', '.join(name(inner) for inner in loader.loaders)})" if hasattr(loader, 'loaders')
+        else name(loader)
+        for loader in backend.engine.template_loaders
+    )
+
+
+def time_per_call(func, iterations):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1000
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    print("=" * 80)
+    print(f"Template cost per request, mean of {iterations} iterations (ms)")
+    print("=" * 80)
+
+    backends = {name: make_backend(name) for name in ('baseline', 'current')}
+    for name, backend in backends.items():
+        print(f"{name:<10}{describe_loaders(backend)}")
+    print()
+    print(f"{'':<28}{'load + parse':^26}{'load + parse + render':^26}")
+    print(f"{'template':<28}{'baseline':>13}{'current':>13}{'baseline':>13}{'current':>13}")
+
+    for template_name, build_context in PAGES:
+        context = build_context()
+        # Prime both engines once, as the warm-up does at boot
+        for backend in backends.values():
+            backend.get_template(template_name)
+
+        parse = {
+            name: time_per_call(lambda: backend.get_template(template_name), iterations)
+            for name, backend in backends.items()
+        }
+        render = {
+            name: time_per_call(lambda: backend.get_template(template_name).render(context), iterations)
+            for name, backend in backends.items()
+        }
+        print(f"{template_name:<28}{parse['baseline']:>13.3f}{parse['current']:>13.3f}"
+              f"{render['baseline']:>13.3f}{render['current']:>13.3f}")
@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
 
 application = get_asgi_application()
+
+# Warm templates and the page cache in the background, see portfolio/warmup.py
+from portfolio import warmup  # noqa: E402
+
+warmup.start_on_boot()
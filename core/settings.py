@@ -28,8 +28,20 @@ load_dotenv(BASE_DIR / '.env')
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = os.environ.get('SECRET_KEY', 'django-insecure-fallback-key-for-dev')
 
+# Deployment profile: 'production' turns debug off. Render sets RENDER in
+# its environment, so deployments there default to production.
+DJANGO_ENV = os.environ.get('DJANGO_ENV', 'production' if os.environ.get('RENDER') else 'development')
+
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+DEBUG = DJANGO_ENV != 'production'
+
+# Canonical origin for absolute links in the sitemap and Open Graph tags
+SITE_URL = os.environ.get('SITE_URL', 'https://darshjilka.me')
+
+# Identifies the deployed code in page cache keys, so a deploy never serves
+# HTML rendered by the previous one. Render provides the commit; without it
+# the app hashes its own source (see portfolio/cache.py build_id)
+BUILD_ID = os.environ.get('BUILD_ID') or os.environ.get('RENDER_GIT_COMMIT', '')
 
 ALLOWED_HOSTS = [
     "darshjilka.me",
@@ -72,13 +84,22 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            # Django has wrapped the default loaders in the cached loader in
+            # every profile since 4.1; this spells the same chain out. In
+            # development the runserver autoreloader resets it when a
+            # template changes (see portfolio/signals.py).
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
         },
     },
 ]
@@ -97,6 +118,21 @@ DATABASES = {
 }
 
 
+# Cache
+# File based so all worker processes share the rendered pages and see
+# invalidations made by whichever worker handled an admin save.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('CACHE_DIR', str(BASE_DIR / '.cache')),
+        'OPTIONS': {
+            'MAX_ENTRIES': 1000,
+        },
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -0,0 +1,152 @@
+"""
+Gunicorn configuration for the portfolio.
+
+    gunicorn core.wsgi -c gunicorn.conf.py
+
+Workers and threads are sized from the CPU count and the memory actually
+available to the container. Every value can be overridden from the
+environment: WEB_CONCURRENCY, GUNICORN_THREADS, GUNICORN_WORKER_CLASS,
+GUNICORN_WORKER_MEMORY_MB, GUNICORN_MAX_REQUESTS and GUNICORN_TIMEOUT.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from pathlib import Path
+
+# Memory budget per worker and for the master. With preload_app a worker
+# measured ~45 MB RSS (~20 MB PSS) and the master ~55 MB; the worker budget
+# leaves headroom for growth between recycles so small instances (512 MB on
+# Render free) stay out of OOM
+WORKER_MEMORY_MB = int(os.environ.get('GUNICORN_WORKER_MEMORY_MB', 64))
+MASTER_MEMORY_MB = 60
+
+# Log per-worker request stats every this many requests
+STATS_EVERY = 500
+
+
+def available_memory_mb():
+    """Memory available to this container: the cgroup limit or MemAvailable, whichever is lower."""
+    limits = []
+    for path in ('/sys/fs/cgroup/memory.max', '/sys/fs/cgroup/memory/memory.limit_in_bytes'):
+        try:
+            value = Path(path).read_text().strip()
+        except OSError:
+            continue
+        if value.isdigit():
+            limits.append(int(value) // (1024 * 1024))
+    try:
+        for line in Path('/proc/meminfo').read_text().splitlines():
+            if line.startswith('MemAvailable:'):
+                limits.append(int(line.split()[1]) // 1024)
+    except OSError:
+        pass
+    return min(limits) if limits else None
+
+
+def available_cpus():
+    """CPUs this container may use: the cgroup quota if set, else the host count."""
+    try:
+        quota, period = Path('/sys/fs/cgroup/cpu.max').read_text().split()
+        if quota != 'max':
+            return max(1, min(multiprocessing.cpu_count(), -(-int(quota) // int(period))))
+    except (OSError, ValueError):
+        pass
+    return multiprocessing.cpu_count()
+
+
+def default_workers():
+    by_cpu = available_cpus() * 2 + 1
+    memory = available_memory_mb()
+    if memory is None:
+        return by_cpu
+    by_memory = (memory - MASTER_MEMORY_MB) // WORKER_MEMORY_MB
+    return max(1, min(by_cpu, by_memory))
+
+
+def default_threads():
+    # Extra threads cover I/O waits (SQLite, the file cache, SMTP on the
+    # contact form) without the memory cost of another process
+    return 4 if available_cpus() <= 2 else 2
+
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', default_workers()))
+
+# Threads only default above 1 for gthread (or no explicit class); an
+# explicit sync/gevent class keeps a single thread
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS')
+threads = int(os.environ.get('GUNICORN_THREADS', default_threads() if worker_class in (None, 'gthread') else 1))
+if worker_class is None or (worker_class == 'sync' and threads > 1):
+    # Gunicorn runs sync with threads > 1 as gthread anyway; say so
+    worker_class = 'gthread' if threads > 1 else 'sync'
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+keepalive = 5
+
+# Import Django and run the warm-up (portfolio/warmup.py) once in the
+# master; forked workers, including ones recycled by max_requests, share
+# that state copy-on-write and are ready immediately
+preload_app = True
+os.environ.setdefault('PORTFOLIO_WARMUP', 'preload')
+
+# Recycle workers to cap slow memory growth; jitter keeps them from
+# restarting all at once
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = max_requests // 10
+
+
+# Per-worker request stats. Hooks run inside each worker process, so this
+# dict is private to the worker after fork.
+_stats = {'requests': 0, 'seconds': 0.0, 'slowest': 0.0}
+_stats_lock = threading.Lock()
+
+
+def log_stats(worker, reason):
+    requests = _stats['requests']
+    mean_ms = _stats['seconds'] / requests * 1000 if requests else 0.0
+    worker.log.info(
+        'Worker %s %s: %d requests, mean %.1f ms, slowest %.1f ms',
+        worker.pid, reason, requests, mean_ms, _stats['slowest'] * 1000,
+    )
+
+
+def on_starting(server):
+    # Runs in the master after the app is preloaded, before any fork
+    if os.environ['PORTFOLIO_WARMUP'] == 'preload':
+        from portfolio import warmup
+        warmup.warm_up()
+
+
+def when_ready(server):
+    server.log.info(
+        'Serving with %d %s workers x %d threads (%d CPUs, %s MB available)',
+        workers, worker_class, threads, available_cpus(), available_memory_mb(),
+    )
+
+
+def post_fork(server, worker):
+    _stats.update(requests=0, seconds=0.0, slowest=0.0)
+    if os.environ['PORTFOLIO_WARMUP'] == 'preload':
+        # Inherited from the master already; be explicit for the worker
+        from portfolio import warmup
+        warmup.mark_ready()
+
+
+def pre_request(worker, req):
+    req.started = time.perf_counter()
+
+
+def post_request(worker, req, environ, resp):
+    duration = time.perf_counter() - getattr(req, 'started', time.perf_counter())
+    with _stats_lock:
+        _stats['requests'] += 1
+        _stats['seconds'] += duration
+        _stats['slowest'] = max(_stats['slowest'], duration)
+        report = _stats['requests'] % STATS_EVERY == 0
+    if report:
+        log_stats(worker, 'stats')
+
+
+def worker_exit(server, worker):
+    log_stats(worker, 'exiting')
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Skill, Project, Achievement, ContactMessage
+from .models import Skill, Project, Achievement, Review, ContactMessage
 
 @admin.register(Skill)
 class SkillAdmin(admin.ModelAdmin):
@@ -13,6 +13,13 @@ class ProjectAdmin(admin.ModelAdmin):
 class AchievementAdmin(admin.ModelAdmin):
     list_display = ('title', 'date')
 
+@admin.register(Review)
+class ReviewAdmin(admin.ModelAdmin):
+    list_display = ('name', 'rating', 'order', 'is_published', 'created_at')
+    list_filter = ('is_published', 'rating')
+    search_fields = ('name', 'text')
+    list_editable = ('order', 'is_published')
+
 @admin.register(ContactMessage)
 class ContactMessageAdmin(admin.ModelAdmin):
     list_display = ('name', 'email', 'created_at', 'is_read')
@@ -0,0 +1,148 @@
+import functools
+import gzip
+import hashlib
+import time
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib import messages
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from django.shortcuts import render
+from django.template.loader import render_to_string
+from django.utils.cache import patch_vary_headers
+
+CONTENT_VERSION_KEY = 'portfolio:content-version'
+
+# Pages are kept until content or code changes, see invalidate_content()
+# and build_id()
+PAGE_TIMEOUT = None
+
+
+@functools.lru_cache(maxsize=None)
+def build_id():
+    """
+    Identifier of the running code, computed once per process.
+
+    settings.BUILD_ID when set; otherwise a hash of the portfolio and core
+    source, the templates and the static manifest, so a restart after any
+    edit (git pull, local changes) starts from fresh pages.
+    """
+    if settings.BUILD_ID:
+        return settings.BUILD_ID[:12]
+    app_dir = Path(apps.get_app_config('portfolio').path)
+    paths = [
+        *sorted(p for p in app_dir.rglob('*') if p.suffix in ('.py', '.html')),
+        *sorted((Path(settings.BASE_DIR) / 'core').glob('*.py')),
+        Path(settings.STATIC_ROOT) / 'staticfiles.json',
+    ]
+    digest = hashlib.sha1()
+    for path in paths:
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            continue
+        digest.update(str(path).encode())
+    return digest.hexdigest()[:12]
+
+
+def content_version():
+    """Current content version; every cached page key includes it."""
+    version = cache.get(CONTENT_VERSION_KEY)
+    if version is None:
+        version = time.time_ns()
+        if not cache.add(CONTENT_VERSION_KEY, version, None):
+            version = cache.get(CONTENT_VERSION_KEY, version)
+    return version
+
+
+def bump_content_version():
+    cache.set(CONTENT_VERSION_KEY, time.time_ns(), None)
+
+
+def invalidate_content(using=None, **kwargs):
+    """
+    Signal receiver: move to a new content version so all cached pages are rebuilt.
+
+    The bump waits for the surrounding transaction to commit. Otherwise another
+    worker could read the old rows and cache them under the new version.
+    """
+    transaction.on_commit(bump_content_version, using=using)
+
+
+def page_key(name):
+    return f'portfolio:page:{build_id()}:{name}:{content_version()}'
+
+
+def get_cached(name, build):
+    """Return a value built by build(), cached under the content version."""
+    key = page_key(name)
+    value = cache.get(key)
+    if value is None:
+        value = build()
+        cache.set(key, value, PAGE_TIMEOUT)
+    return value
+
+
+def get_page(name, template_name, build_context):
+    """Return the rendered HTML for a page, rendering and caching it on a miss."""
+    key = page_key(name)
+    html = cache.get(key)
+    if html is None:
+        html = render_to_string(template_name, build_context())
+        cache.set(key, html, PAGE_TIMEOUT)
+    return html
+
+
+def cached_page(request, name, template_name, build_context):
+    """
+    Serve a page from the cache.
+
+    Cached pages are rendered without a request, so a request carrying
+    flash messages is rendered normally to show them.
+    """
+    if len(messages.get_messages(request)):
+        return render(request, template_name, build_context())
+    return HttpResponse(get_page(name, template_name, build_context))
+
+
+def get_compressed(name, build):
+    """Return (body, gzipped body) for generated text, building and caching both on a miss."""
+    key = page_key(name)
+    bodies = cache.get(key)
+    if bodies is None:
+        body = build().encode()
+        bodies = (body, gzip.compress(body, mtime=0))
+        cache.set(key, bodies, PAGE_TIMEOUT)
+    return bodies
+
+
+def accepts_gzip(request):
+    """True if Accept-Encoding allows gzip with a non-zero q-value, explicitly or via *."""
+    qvalues = {}
+    for part in request.META.get('HTTP_ACCEPT_ENCODING', '').split(','):
+        coding, *params = part.split(';')
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding.strip().lower()] = q
+    return qvalues.get('gzip', qvalues.get('*', 0.0)) > 0
+
+
+def compressed_response(request, name, build, content_type):
+    """Serve generated text from the cache, precompressed when the client accepts gzip."""
+    body, gzipped = get_compressed(name, build)
+    if accepts_gzip(request):
+        response = HttpResponse(gzipped, content_type=content_type)
+        response['Content-Encoding'] = 'gzip'
+    else:
+        response = HttpResponse(body, content_type=content_type)
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
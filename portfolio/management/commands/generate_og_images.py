@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from portfolio.cache import invalidate_content
+from portfolio.models import Project
+from portfolio.og_images import ensure_og_image
+
+
+class Command(BaseCommand):
+    help = 'Render Open Graph preview images for projects that are missing one or are out of date.'
+
+    def handle(self, *args, **options):
+        generated = sum(ensure_og_image(project) for project in Project.objects.all())
+        if generated:
+            invalidate_content()
+        self.stdout.write(self.style.SUCCESS(f'Generated {generated} OG images'))
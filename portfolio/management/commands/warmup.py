@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from portfolio.warmup import warm_up
+
+
+class Command(BaseCommand):
+    help = 'Preload templates and pre-render the main pages into the shared page cache.'
+
+    def handle(self, *args, **options):
+        stats = warm_up()
+        self.stdout.write(self.style.SUCCESS(
+            f"Warmed {stats['templates']} templates and {stats['pages']} pages "
+            f"({stats['errors']} errors) in {stats['seconds']}s"
+        ))
@@ -0,0 +1,30 @@
+# Generated by Django 5.0.1 on 2026-10-19 19:27
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0002_contactmessage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Review',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200)),
+                ('text', models.TextField()),
+                ('rating', models.PositiveSmallIntegerField(default=5, help_text='Stars 1-5', validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(5)])),
+                ('order', models.PositiveIntegerField(default=0, help_text='Lower numbers are shown first')),
+                ('is_published', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['order', '-created_at'],
+                'indexes': [models.Index(fields=['is_published', 'order', '-created_at'], name='portfolio_review_order_idx')],
+            },
+        ),
+    ]
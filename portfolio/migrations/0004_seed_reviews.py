@@ -0,0 +1,33 @@
+from django.db import migrations
+
+# Testimonials that used to be hardcoded in views.about
+REVIEWS = [
+    ("Aditya Sharma", "Darsh transformed our manual workflows into a seamless automated system. Efficiency increased by 300% in just two weeks."),
+    ("Rohan Mehta", "The ROI was immediate. The revenue tracking dashboard he built gave us insights we didn't know we needed. Highly recommended."),
+    ("Priya Patel", "Exceptional code quality and attention to detail. He delivered the project ahead of schedule and the documentation was perfect."),
+    ("Arjun Singh", "Rarely do you find a developer who understands design this well. The final product looked even better than our mockups."),
+]
+
+
+def seed_reviews(apps, schema_editor):
+    Review = apps.get_model('portfolio', 'Review')
+    Review.objects.bulk_create(
+        Review(name=name, text=text, rating=5, order=order)
+        for order, (name, text) in enumerate(REVIEWS)
+    )
+
+
+def unseed_reviews(apps, schema_editor):
+    Review = apps.get_model('portfolio', 'Review')
+    Review.objects.filter(name__in=[name for name, _ in REVIEWS]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0003_review'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_reviews, unseed_reviews),
+    ]
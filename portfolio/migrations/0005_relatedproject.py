@@ -0,0 +1,52 @@
+# Generated by Django 5.0.1 on 2026-10-19 19:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# Frozen copy of portfolio.related as of this migration, so later changes
+# there can't break migrating a fresh database
+def tag_set(tech_stack):
+    return {t.strip().lower() for t in tech_stack.split(',') if t.strip()} if tech_stack else set()
+
+
+def backfill_related_projects(apps, schema_editor):
+    Project = apps.get_model('portfolio', 'Project')
+    RelatedProject = apps.get_model('portfolio', 'RelatedProject')
+    projects = [(pk, tag_set(tech_stack)) for pk, tech_stack in Project.objects.values_list('pk', 'tech_stack')]
+    rows = []
+    for index, (pk, tags) in enumerate(projects):
+        for other_pk, other_tags in projects[index + 1:]:
+            score = len(tags & other_tags)
+            if score:
+                rows.append(RelatedProject(project_id=pk, related_id=other_pk, score=score))
+                rows.append(RelatedProject(project_id=other_pk, related_id=pk, score=score))
+    RelatedProject.objects.bulk_create(rows)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0004_seed_reviews'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedProject',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.PositiveSmallIntegerField()),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_scores', to='portfolio.project')),
+                ('related', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='portfolio.project')),
+            ],
+            options={
+                'ordering': ['-score', 'related_id'],
+                'indexes': [models.Index(fields=['project', '-score'], name='portfolio_related_score_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='relatedproject',
+            constraint=models.UniqueConstraint(fields=('project', 'related'), name='portfolio_relatedproject_unique'),
+        ),
+        migrations.RunPython(backfill_related_projects, migrations.RunPython.noop),
+    ]
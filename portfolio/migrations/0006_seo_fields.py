@@ -0,0 +1,44 @@
+# Generated by Django 5.0.1 on 2026-10-19 19:30
+
+import datetime
+
+from django.db import migrations, models
+
+
+def backfill_updated_at(apps, schema_editor):
+    # AddField stamps every existing row with the migration time; use the
+    # dates the content already has instead, so sitemap lastmod stays honest
+    Project = apps.get_model('portfolio', 'Project')
+    Achievement = apps.get_model('portfolio', 'Achievement')
+    Project.objects.update(updated_at=models.F('created_at'))
+    achievements = list(Achievement.objects.only('pk', 'date'))
+    for achievement in achievements:
+        achievement.updated_at = datetime.datetime.combine(achievement.date, datetime.time.min, tzinfo=datetime.timezone.utc)
+    # bulk_update() writes the values as set; save() would apply auto_now
+    Achievement.objects.bulk_update(achievements, ['updated_at'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0005_relatedproject'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='achievement',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='og_image',
+            field=models.ImageField(blank=True, editable=False, help_text='Generated link preview, see portfolio/og_images.py', upload_to='projects/og/'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+    ]
@@ -1,3 +1,4 @@
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 
 class Skill(models.Model):
@@ -16,20 +17,60 @@ class Project(models.Model):
     github_link = models.URLField(blank=True)
     live_link = models.URLField(blank=True)
     tech_stack = models.CharField(max_length=200, help_text="Comma separated tags")
+    og_image = models.ImageField(upload_to='projects/og/', blank=True, editable=False,
+                                 help_text="Generated link preview, see portfolio/og_images.py")
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.title
 
+class RelatedProject(models.Model):
+    """Shared tech tag count between two projects, refreshed when a project is saved."""
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='related_scores')
+    related = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='+')
+    score = models.PositiveSmallIntegerField()
+
+    class Meta:
+        ordering = ['-score', 'related_id']
+        constraints = [
+            models.UniqueConstraint(fields=['project', 'related'], name='portfolio_relatedproject_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['project', '-score'], name='portfolio_related_score_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.project} -> {self.related} ({self.score})"
+
 class Achievement(models.Model):
     title = models.CharField(max_length=200)
     description = models.TextField()
     image = models.ImageField(upload_to='achievements/')
     date = models.DateField()
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.title
 
+class Review(models.Model):
+    name = models.CharField(max_length=200)
+    text = models.TextField()
+    rating = models.PositiveSmallIntegerField(
+        default=5, validators=[MinValueValidator(1), MaxValueValidator(5)], help_text="Stars 1-5")
+    order = models.PositiveIntegerField(default=0, help_text="Lower numbers are shown first")
+    is_published = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['order', '-created_at']
+        indexes = [
+            models.Index(fields=['is_published', 'order', '-created_at'], name='portfolio_review_order_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.rating}/5)"
+
 class ContactMessage(models.Model):
     name = models.CharField(max_length=200)
     email = models.EmailField()
@@ -0,0 +1,111 @@
+"""
+Open Graph preview images for projects.
+
+Each project gets a 1200x630 card with its title over a darkened crop of
+its screenshot. The card is rendered once the project's save is committed
+and stored in MEDIA_ROOT; the file name carries a hash of the title and source
+image, so unchanged projects are never re-rendered.
+"""
+
+import hashlib
+import io
+import logging
+import textwrap
+
+from django.core.files.base import ContentFile
+from django.db import transaction
+from PIL import Image, ImageDraw, ImageFont, ImageOps
+
+from .models import Project
+
+logger = logging.getLogger(__name__)
+
+OG_SIZE = (1200, 630)
+TITLE_SIZE = 72
+FOOTER_SIZE = 32
+FOOTER_TEXT = 'darshjilka.me'
+
+
+def og_image_name(project):
+    """Storage name for the card matching the project's current title and image."""
+    source = f'{project.title}\0{project.image.name}'.encode()
+    return f'og_project_{project.pk}_{hashlib.sha1(source).hexdigest()[:12]}.jpg'
+
+
+def render_og_image(title, image_file):
+    """Return JPEG bytes for a preview card with title over the resized screenshot."""
+    with Image.open(image_file) as source:
+        card = ImageOps.fit(source.convert('RGB'), OG_SIZE, Image.Resampling.LANCZOS)
+
+    # Darken towards the bottom so the title stays readable on any screenshot
+    shade = Image.linear_gradient('L').resize(OG_SIZE).point(lambda v: 60 + v * 160 // 255)
+    card = Image.composite(Image.new('RGB', OG_SIZE, (5, 5, 5)), card, shade)
+
+    draw = ImageDraw.Draw(card)
+    title_font = ImageFont.load_default(size=TITLE_SIZE)
+    footer_font = ImageFont.load_default(size=FOOTER_SIZE)
+    lines = textwrap.wrap(title, width=28)[:3]
+    line_height = TITLE_SIZE + 12
+    y = OG_SIZE[1] - 80 - FOOTER_SIZE - line_height * len(lines)
+    for line in lines:
+        draw.text((72, y), line, font=title_font, fill=(255, 255, 255))
+        y += line_height
+    draw.text((72, OG_SIZE[1] - 60 - FOOTER_SIZE), FOOTER_TEXT, font=footer_font, fill=(156, 163, 175))
+
+    output = io.BytesIO()
+    card.save(output, 'JPEG', quality=85, optimize=True)
+    return output.getvalue()
+
+
+def og_image_is_current(project):
+    """Whether the stored card matches the project's current title and image."""
+    current = project.og_image.name
+    return (
+        bool(current)
+        and current.rsplit('/', 1)[-1] == og_image_name(project)
+        and project.og_image.storage.exists(current)
+    )
+
+
+def ensure_og_image(project):
+    """Render and store the project's card once the save is committed, if it is missing or out of date."""
+    if not project.image or og_image_is_current(project):
+        return False
+    # Robust so a failed render can't stop the page cache invalidation
+    # queued after it
+    transaction.on_commit(lambda: write_og_image(project.pk), robust=True)
+    return True
+
+
+def write_og_image(pk):
+    """Render the card for the committed project and swap it in for the old one."""
+    project = Project.objects.filter(pk=pk).first()
+    if project is None or not project.image or og_image_is_current(project):
+        return
+
+    name = og_image_name(project)
+    try:
+        content = render_og_image(project.title, project.image)
+    except (OSError, ValueError) as exc:
+        logger.warning('Could not render OG image for project %s: %s', project.pk, exc)
+        return
+
+    storage = project.og_image.storage
+    current = project.og_image.name
+    if current:
+        storage.delete(current)
+    # A leftover file at the target name would make storage pick a suffixed
+    # name, and og_image_is_current() would then never match again
+    target = project.og_image.field.generate_filename(project, name)
+    if storage.exists(target):
+        storage.delete(target)
+    project.og_image.save(name, ContentFile(content), save=False)
+    # update() rather than save() so post_save handlers don't run again
+    Project.objects.filter(pk=project.pk).update(og_image=project.og_image.name)
+
+
+def delete_og_image(project):
+    """Remove the project's card from storage once the deletion is committed."""
+    if project.og_image:
+        storage, name = project.og_image.storage, project.og_image.name
+        transaction.on_commit(lambda: storage.delete(name))
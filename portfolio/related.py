@@ -0,0 +1,30 @@
+from django.db import transaction
+from django.db.models import Q
+
+from .models import Project, RelatedProject
+
+
+def tag_set(tech_stack):
+    """Normalised tags of a comma separated tech_stack."""
+    return {t.strip().lower() for t in tech_stack.split(',') if t.strip()} if tech_stack else set()
+
+
+def related_rows(project_pk, tech_stack, others):
+    """Score rows in both directions between one project and (pk, tech_stack) pairs."""
+    tags = tag_set(tech_stack)
+    rows = []
+    for other_pk, other_stack in others:
+        score = len(tags & tag_set(other_stack))
+        if score:
+            rows.append(RelatedProject(project_id=project_pk, related_id=other_pk, score=score))
+            rows.append(RelatedProject(project_id=other_pk, related_id=project_pk, score=score))
+    return rows
+
+
+def refresh_related_projects(project):
+    """Recompute the scores between project and every other project."""
+    others = Project.objects.exclude(pk=project.pk).values_list('pk', 'tech_stack')
+    rows = related_rows(project.pk, project.tech_stack, others)
+    with transaction.atomic():
+        RelatedProject.objects.filter(Q(project=project) | Q(related=project)).delete()
+        RelatedProject.objects.bulk_create(rows)
@@ -0,0 +1,36 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.autoreload import file_changed
+
+from .cache import invalidate_content
+from .models import Skill, Project, Achievement, Review
+from .og_images import delete_og_image, ensure_og_image
+from .related import refresh_related_projects
+
+CONTENT_MODELS = (Skill, Project, Achievement, Review)
+
+
+# Connected before the invalidation below so pages are re-rendered with fresh scores
+@receiver(post_save, sender=Project, dispatch_uid='refresh_related_projects')
+def project_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        refresh_related_projects(instance)
+        ensure_og_image(instance)
+
+
+@receiver(post_delete, sender=Project, dispatch_uid='delete_og_image')
+def project_deleted(sender, instance, **kwargs):
+    delete_og_image(instance)
+
+
+for model in CONTENT_MODELS:
+    post_save.connect(invalidate_content, sender=model, dispatch_uid=f'invalidate_content_save_{model.__name__}')
+    post_delete.connect(invalidate_content, sender=model, dispatch_uid=f'invalidate_content_delete_{model.__name__}')
+
+
+@receiver(file_changed, dispatch_uid='portfolio_source_changed')
+def source_changed(sender, file_path, **kwargs):
+    # Dev server: the page cache lives on disk and survives runserver's
+    # restart, so any edit (templates or the view code that builds their
+    # context) must drop the pages rendered from the old code
+    invalidate_content()
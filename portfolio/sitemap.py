@@ -0,0 +1,42 @@
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.db.models import Max
+from django.urls import reverse
+
+from .models import Project, Achievement
+
+
+def sitemap_entry(path, lastmod=None):
+    loc = escape(settings.SITE_URL + path)
+    lastmod_tag = f'<lastmod>{lastmod.date().isoformat()}</lastmod>' if lastmod else ''
+    return f'<url><loc>{loc}</loc>{lastmod_tag}</url>'
+
+
+def build_sitemap():
+    projects = list(Project.objects.order_by('-created_at').values_list('pk', 'updated_at'))
+    achievements_updated = Achievement.objects.aggregate(latest=Max('updated_at'))['latest']
+    projects_updated = max((updated for _, updated in projects), default=None)
+
+    entries = [
+        sitemap_entry(reverse('home')),
+        sitemap_entry(reverse('projects'), projects_updated),
+        sitemap_entry(reverse('gallery'), achievements_updated),
+        sitemap_entry(reverse('about')),
+    ]
+    entries += [sitemap_entry(reverse('project_detail', args=[pk]), updated) for pk, updated in projects]
+
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+        + '\n'.join(entries)
+        + '\n</urlset>\n'
+    )
+
+
+def build_robots():
+    return (
+        'User-agent: *\n'
+        'Disallow: /admin/\n'
+        f'Sitemap: {settings.SITE_URL}{reverse("sitemap")}\n'
+    )
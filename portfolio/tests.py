@@ -1,3 +1,327 @@
-from django.test import TestCase
+import importlib.util
+import io
+import multiprocessing
+import os
+import runpy
+import tempfile
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from PIL import Image
+
+from . import warmup
+from .cache import accepts_gzip, build_id, content_version
+from .models import Project, RelatedProject, Review, Skill
+from .related import tag_set
+
+# Per-test in-memory cache, and plain static storage so templates render
+# without a collectstatic manifest
+TEST_SETTINGS = {
+    'CACHES': {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    'STATICFILES_STORAGE': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+}
+
+FLASH_MESSAGE = 'Message sent successfully! I will get back to you soon.'
+
+
+@override_settings(**TEST_SETTINGS)
+class PageCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_second_request_is_a_cache_hit(self):
+        Skill.objects.create(name='Python', proficiency=90)
+        self.client.get(reverse('home'))
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('home'))
+        self.assertContains(response, 'Python')
+
+    def test_save_invalidates_cached_pages(self):
+        self.client.get(reverse('home'))
+        with self.captureOnCommitCallbacks(execute=True):
+            Skill.objects.create(name='Rust', proficiency=50)
+
+        self.assertContains(self.client.get(reverse('home')), 'Rust')
+
+    def test_version_moves_only_after_commit(self):
+        version = content_version()
+        with self.captureOnCommitCallbacks() as callbacks:
+            Skill.objects.create(name='Go', proficiency=40)
+            self.assertEqual(content_version(), version)
+
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(content_version(), version)
+
+    def test_new_build_does_not_reuse_old_pages(self):
+        self.addCleanup(build_id.cache_clear)
+        self.client.get(reverse('gallery'))
+        self.assertIsNone(self.client.get(reverse('gallery')).context)
+
+        build_id.cache_clear()
+        with override_settings(BUILD_ID='next-deploy'):
+            self.assertIsNotNone(self.client.get(reverse('gallery')).context)
+
+    def test_flash_message_bypasses_cache(self):
+        self.client.get(reverse('home'))
+
+        response = self.client.get(reverse('home'), {'success': 'true'})
+        self.assertEqual([str(m) for m in response.context['messages']], [FLASH_MESSAGE])
+
+        # The message is consumed and the cached page is served again
+        response = self.client.get(reverse('home'))
+        self.assertIsNone(response.context)
+
+    def test_out_of_range_review_pages_reuse_the_resolved_page(self):
+        Review.objects.create(name='Ana', text='Great work')
+        self.client.get(reverse('about'))
+
+        for page in ('0', '2', '59', 'abc'):
+            response = self.client.get(reverse('about'), {'page': page})
+            self.assertContains(response, 'Great work')
+            # Served from page 1's cache entry, not rendered again
+            self.assertIsNone(response.context)
+
+    def test_review_page_miss_loads_only_its_slice(self):
+        Review.objects.all().delete()  # drop the reviews seeded by 0004
+        Review.objects.bulk_create(Review(name=f'Client {i}', text=f'Review {i}', order=i) for i in range(12))
+        self.client.get(reverse('about'))
+
+        # The count is cached already; page 2 costs one query for its reviews
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('about'), {'page': '2'})
+        self.assertEqual(response.context['page_obj'].number, 2)
+        self.assertContains(response, '"Review 11"')
+        self.assertNotContains(response, '"Review 9"')
+        self.assertContains(response, 'Previous')
+
+    def test_sitemap_respects_gzip_qvalues(self):
+        for header, gzipped in [
+            ('gzip, br', True),
+            ('br;q=1, gzip;q=0.5', True),
+            ('gzip;q=0', False),
+            ('gzip;q=0, *', False),
+            ('*;q=0.1', True),
+            ('identity', False),
+        ]:
+            with self.subTest(header=header):
+                self.assertIs(accepts_gzip(RequestFactory().get('/', HTTP_ACCEPT_ENCODING=header)), gzipped)
+
+        response = self.client.get(reverse('sitemap'), HTTP_ACCEPT_ENCODING='gzip;q=0')
+        self.assertNotIn('Content-Encoding', response)
+        self.assertContains(response, '<urlset')
+
+
+class ReadinessTests(TestCase):
+    def setUp(self):
+        self.addCleanup(warmup._state.update, ready=warmup.is_ready())
+        warmup._state['ready'] = False
+
+    def test_healthz_is_always_ok(self):
+        self.assertEqual(self.client.get(reverse('healthz')).status_code, 200)
+
+    def test_readyz_waits_for_mark_ready(self):
+        response = self.client.get(reverse('readyz'))
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()['status'], 'warming')
+
+        warmup.mark_ready()
+        response = self.client.get(reverse('readyz'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['status'], 'ready')
+
+
+class SettingsProfileTests(SimpleTestCase):
+    def load_settings(self, **env):
+        """Execute core/settings.py with only the given environment and no .env file."""
+        with mock.patch.dict(os.environ, env, clear=True), mock.patch('dotenv.load_dotenv'):
+            return runpy.run_path(str(Path(settings.BASE_DIR) / 'core' / 'settings.py'))
+
+    def test_environment_selects_debug(self):
+        for env, debug in [
+            ({}, True),
+            ({'RENDER': 'true'}, False),
+            ({'DJANGO_ENV': 'production'}, False),
+            ({'RENDER': 'true', 'DJANGO_ENV': 'development'}, True),
+        ]:
+            with self.subTest(env=env):
+                self.assertIs(self.load_settings(**env)['DEBUG'], debug)
+
+
+@override_settings(**TEST_SETTINGS)
+class RelatedProjectTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        media_root = self.enterContext(tempfile.TemporaryDirectory())
+        self.enterContext(override_settings(MEDIA_ROOT=media_root))
+
+    def make_project(self, title, tech_stack):
+        screenshot = io.BytesIO()
+        Image.new('RGB', (64, 36), 'navy').save(screenshot, 'PNG')
+        # Committed, so the OG card queued by the save is written
+        with self.captureOnCommitCallbacks(execute=True):
+            return Project.objects.create(
+                title=title,
+                description='A project',
+                tech_stack=tech_stack,
+                image=SimpleUploadedFile('shot.png', screenshot.getvalue(), content_type='image/png'),
+            )
+
+    def scores(self, project):
+        return dict(RelatedProject.objects.filter(project=project).values_list('related__title', 'score'))
+
+    def test_tag_normalisation(self):
+        self.assertEqual(tag_set(' Python, django ,, React,'), {'python', 'django', 'react'})
+        self.assertEqual(tag_set(''), set())
+
+    def test_rows_in_both_directions(self):
+        web = self.make_project('Web', 'Python, Django, HTML')
+        api = self.make_project('API', 'python , django')
+        self.make_project('Game', 'C#, Unity')
+
+        self.assertEqual(self.scores(web), {'API': 2})
+        self.assertEqual(self.scores(api), {'Web': 2})
+
+    def test_resave_replaces_old_rows(self):
+        web = self.make_project('Web', 'Python, Django')
+        api = self.make_project('API', 'Python')
+        game = self.make_project('Game', 'Unity')
+
+        api.tech_stack = 'Unity'
+        api.save()
+
+        self.assertEqual(self.scores(web), {})
+        self.assertEqual(self.scores(api), {'Game': 1})
+        self.assertEqual(self.scores(game), {'API': 1})
+
+    def test_detail_page_uses_four_queries_on_a_cache_miss(self):
+        projects = [self.make_project(f'Project {i}', 'Python, Django') for i in range(6)]
+        cache.clear()
+
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse('project_detail', args=[projects[2].pk]))
+        self.assertEqual(response.context['previous_project'], projects[1])
+        self.assertEqual(response.context['next_project'], projects[3])
+        self.assertEqual(len(response.context['related_projects']), 3)
+
+    def test_og_image_removed_with_project(self):
+        project = self.make_project('Web', 'Python')
+        project.refresh_from_db()
+        path = project.og_image.path
+        self.assertTrue(os.path.exists(path))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            project.delete()
+        self.assertFalse(os.path.exists(path))
+
+    def test_og_image_keeps_its_hashed_name_over_a_leftover_file(self):
+        project = self.make_project('Web', 'Python')
+        project.refresh_from_db()
+        expected = project.og_image.name
+
+        # File on disk, field emptied: the card must reuse the exact name
+        Project.objects.filter(pk=project.pk).update(og_image='')
+        project.refresh_from_db()
+        with self.captureOnCommitCallbacks(execute=True):
+            project.save()
+        project.refresh_from_db()
+        self.assertEqual(project.og_image.name, expected)
+
+    def test_og_image_is_swapped_only_after_commit(self):
+        project = self.make_project('Web', 'Python')
+        project.refresh_from_db()
+        old_path = project.og_image.path
+
+        project.title = 'Web, renamed'
+        with self.captureOnCommitCallbacks() as callbacks:
+            project.save()
+        # Not committed yet: the old card is untouched and nothing new is written
+        project.refresh_from_db()
+        self.assertEqual(project.og_image.path, old_path)
+        self.assertEqual(os.listdir(os.path.dirname(old_path)), [os.path.basename(old_path)])
+
+        for callback in callbacks:
+            callback()
+        project.refresh_from_db()
+        self.assertNotEqual(project.og_image.path, old_path)
+        self.assertTrue(os.path.exists(project.og_image.path))
+        self.assertFalse(os.path.exists(old_path))
+
+
+MEMINFO = 'MemTotal:        8000000 kB\nMemAvailable:    2097152 kB\n'
+GUNICORN_ENV = ('WEB_CONCURRENCY', 'GUNICORN_THREADS', 'GUNICORN_WORKER_CLASS', 'PORTFOLIO_WARMUP')
+
+
+class GunicornConfigTests(SimpleTestCase):
+    def load_config(self, **env):
+        """Execute gunicorn.conf.py with the given environment, leaving os.environ untouched."""
+        with mock.patch.dict(os.environ, env):
+            for key in GUNICORN_ENV:
+                if key not in env:
+                    os.environ.pop(key, None)
+            spec = importlib.util.spec_from_file_location('gunicorn_conf', Path(settings.BASE_DIR) / 'gunicorn.conf.py')
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        return module
+
+    def fake_files(self, files, cpus=8):
+        def read_text(path, *args, **kwargs):
+            if str(path) not in files:
+                raise FileNotFoundError(path)
+            return files[str(path)]
+
+        self.enterContext(mock.patch.object(Path, 'read_text', read_text))
+        self.enterContext(mock.patch.object(multiprocessing, 'cpu_count', return_value=cpus))
+
+    def test_available_cpus_follows_the_cgroup_quota(self):
+        config = self.load_config()
+        for cpu_max, expected in [('150000 100000', 2), ('50000 100000', 1), ('max 100000', 8), (None, 8)]:
+            with self.subTest(cpu_max=cpu_max):
+                self.fake_files({'/sys/fs/cgroup/cpu.max': cpu_max} if cpu_max else {})
+                self.assertEqual(config.available_cpus(), expected)
+
+    def test_available_memory_is_the_lowest_limit(self):
+        config = self.load_config()
+        for files, expected in [
+            ({'/sys/fs/cgroup/memory.max': '536870912', '/proc/meminfo': MEMINFO}, 512),
+            ({'/sys/fs/cgroup/memory.max': 'max', '/proc/meminfo': MEMINFO}, 2048),
+            ({'/sys/fs/cgroup/memory/memory.limit_in_bytes': '1073741824'}, 1024),
+            ({}, None),
+        ]:
+            with self.subTest(files=files):
+                self.fake_files(files)
+                self.assertEqual(config.available_memory_mb(), expected)
+
+    def test_default_workers_is_capped_by_cpu_and_memory(self):
+        config = self.load_config()
+        for files, cpus, expected in [
+            ({'/sys/fs/cgroup/cpu.max': '100000 100000', '/sys/fs/cgroup/memory.max': '536870912'}, 8, 3),
+            ({'/sys/fs/cgroup/memory.max': '536870912'}, 8, 7),
+            ({}, 8, 17),
+            ({'/sys/fs/cgroup/memory.max': '104857600'}, 8, 1),
+        ]:
+            with self.subTest(files=files, cpus=cpus):
+                self.fake_files(files, cpus)
+                self.assertEqual(config.default_workers(), expected)
+
+    def test_explicit_worker_class_keeps_one_thread(self):
+        for env, worker_class, threads in [
+            ({'GUNICORN_WORKER_CLASS': 'sync'}, 'sync', 1),
+            ({'GUNICORN_WORKER_CLASS': 'gevent'}, 'gevent', 1),
+            ({'GUNICORN_WORKER_CLASS': 'sync', 'GUNICORN_THREADS': '4'}, 'gthread', 4),
+            ({'GUNICORN_THREADS': '1'}, 'sync', 1),
+            ({'GUNICORN_THREADS': '4'}, 'gthread', 4),
+        ]:
+            with self.subTest(env=env):
+                config = self.load_config(**env)
+                self.assertEqual((config.worker_class, config.threads), (worker_class, threads))
+
+    def test_preload_warm_up_mode_is_set_without_leaking(self):
+        self.assertEqual(self.load_config().preload_app, True)
+        self.assertNotEqual(os.environ.get('PORTFOLIO_WARMUP'), 'preload')
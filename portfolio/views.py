@@ -1,13 +1,23 @@
-from django.shortcuts import render, redirect, get_object_or_404
+from django.shortcuts import redirect, get_object_or_404
 from django.core.mail import send_mail
 from django.contrib import messages
-from .models import Skill, Project, Achievement, ContactMessage
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.http import JsonResponse
+from .cache import cached_page, compressed_response, get_cached
+from .models import Skill, Project, Achievement, Review, RelatedProject, ContactMessage
+from .sitemap import build_sitemap, build_robots
+from . import warmup
 
 def home(request):
     # Check for success parameter from FormSubmit redirect
     if request.GET.get('success') == 'true':
         messages.success(request, 'Message sent successfully! I will get back to you soon.')
 
+    return cached_page(request, 'home', 'portfolio/home.html', home_context)
+
+def home_context():
     skills = list(Skill.objects.all())
     # Projects logic moved to projects view
 
@@ -52,16 +62,22 @@ def home(request):
     
     skills_html = "".join(skills_html_parts)
     
-    return render(request, 'portfolio/home.html', {
+    return {
         'skills': skills,
         'skills_html': skills_html,
-    })
+    }
 
 def gallery(request):
+    return cached_page(request, 'gallery', 'portfolio/gallery.html', gallery_context)
+
+def gallery_context():
     achievements = Achievement.objects.all()
-    return render(request, 'portfolio/gallery.html', {'achievements': achievements})
+    return {'achievements': achievements}
 
 def projects(request):
+    return cached_page(request, 'projects', 'portfolio/projects.html', projects_context)
+
+def projects_context():
     projects_list = list(Project.objects.all())
     for project in projects_list:
         project.tag_html = ""
@@ -71,7 +87,7 @@ def projects(request):
             for tag in tags:
                 html_parts.append(f'<span class="px-4 py-2 bg-white/5 border border-white/10 rounded-full text-sm text-gray-300 font-mono">{tag}</span>')
             project.tag_html = "".join(html_parts)
-    return render(request, 'portfolio/projects.html', {'projects': projects_list})
+    return {'projects': projects_list}
 
 def contact(request):
     if request.method == 'POST':
@@ -106,31 +122,79 @@ def contact(request):
     return redirect('home')
 
 def project_detail(request, pk):
+    return cached_page(request, f'project_detail:{pk}', 'portfolio/project_detail.html',
+                       lambda: project_detail_context(pk))
+
+RELATED_PROJECTS_LIMIT = 3
+
+def project_detail_context(pk):
+    # Four queries regardless of project count: the project, its two
+    # neighbours by created_at and the precomputed related projects
     project = get_object_or_404(Project, pk=pk)
     tags = [t.strip() for t in project.tech_stack.split(',')] if project.tech_stack else []
-    return render(request, 'portfolio/project_detail.html', {'project': project, 'tags': tags})
 
-def about(request):
-    reviews = [
-        {
-            "name": "Aditya Sharma",
-            "text": "Darsh transformed our manual workflows into a seamless automated system. Efficiency increased by 300% in just two weeks.",
-            "rating": 5
-        },
-        {
-            "name": "Rohan Mehta",
-            "text": "The ROI was immediate. The revenue tracking dashboard he built gave us insights we didn't know we needed. Highly recommended.",
-            "rating": 5
-        },
-        {
-            "name": "Priya Patel",
-            "text": "Exceptional code quality and attention to detail. He delivered the project ahead of schedule and the documentation was perfect.",
-            "rating": 5
-        },
-        {
-            "name": "Arjun Singh",
-            "text": "Rarely do you find a developer who understands design this well. The final product looked even better than our mockups.",
-            "rating": 5
-        }
+    neighbours = Project.objects.only('pk', 'title')
+    previous_project = neighbours.filter(
+        Q(created_at__lt=project.created_at) | Q(created_at=project.created_at, pk__lt=project.pk)
+    ).order_by('-created_at', '-pk').first()
+    next_project = neighbours.filter(
+        Q(created_at__gt=project.created_at) | Q(created_at=project.created_at, pk__gt=project.pk)
+    ).order_by('created_at', 'pk').first()
+
+    related_projects = [
+        row.related for row in
+        RelatedProject.objects.filter(project=project).select_related('related')[:RELATED_PROJECTS_LIMIT]
     ]
-    return render(request, 'portfolio/about.html', {'reviews': reviews})
+    return {
+        'project': project,
+        'tags': tags,
+        'previous_project': previous_project,
+        'next_project': next_project,
+        'related_projects': related_projects,
+        'site_url': settings.SITE_URL,
+    }
+
+REVIEWS_PER_PAGE = 10
+
+def about(request):
+    # Key on the resolved page so junk or out-of-range ?page= values share
+    # the cache entry of the page they are clamped to
+    number = review_page_number(request.GET.get('page'))
+    return cached_page(request, f'about:{number}', 'portfolio/about.html',
+                       lambda: about_context(number))
+
+def review_count():
+    # Only the count is cached; a page's reviews are loaded when it renders
+    return get_cached('review_count', lambda: Review.objects.filter(is_published=True).count())
+
+def review_page_number(number):
+    num_pages = max(1, -(-review_count() // REVIEWS_PER_PAGE))
+    try:
+        number = int(number)
+    except (TypeError, ValueError):
+        return 1
+    return min(max(number, 1), num_pages)
+
+def about_context(number=1):
+    paginator = Paginator(Review.objects.filter(is_published=True), REVIEWS_PER_PAGE)
+    # Reuse the cached count so a miss runs only the slice query
+    paginator.count = review_count()
+    page_obj = paginator.page(number)
+    return {'reviews': page_obj, 'page_obj': page_obj}
+
+def sitemap(request):
+    return compressed_response(request, 'sitemap', build_sitemap, 'application/xml')
+
+def robots(request):
+    return compressed_response(request, 'robots', build_robots, 'text/plain')
+
+def healthz(request):
+    # Liveness: the process is up and serving requests
+    return JsonResponse({'status': 'ok'})
+
+def readyz(request):
+    # Readiness: only report ready once the startup warm-up has finished
+    if not warmup.is_ready():
+        return JsonResponse({'status': 'warming'}, status=503)
+    return JsonResponse({'status': 'ready', **warmup.get_stats()})
+
@@ -0,0 +1,123 @@
+"""
+Startup warm-up for cold starts.
+
+Free-tier hosts spin the app down when idle, so the first visitor would pay
+for template compilation, cold database pages and rendering. start() runs
+warm_up() in a background thread once the app is loaded, and /readyz only
+reports ready after it has finished.
+
+PORTFOLIO_WARMUP selects how it runs: '1' (default) in a background thread
+once core/wsgi.py or core/asgi.py is imported; 'preload' leaves it to a
+pre-forking server, which calls warm_up() synchronously in its master
+before forking so workers inherit a warm process (see gunicorn.conf.py);
+'0' never.
+"""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+from django.apps import apps
+from django.db import connections
+from django.template.loader import get_template
+
+logger = logging.getLogger(__name__)
+
+_state = {
+    'ready': False,
+    'templates': 0,
+    'pages': 0,
+    'errors': 0,
+    'seconds': None,
+}
+
+
+def is_ready():
+    return _state['ready']
+
+
+def get_stats():
+    return {key: value for key, value in _state.items() if key != 'ready'}
+
+
+def mark_ready():
+    _state['ready'] = True
+
+
+def preload_templates():
+    """Compile every portfolio template so the cached loader holds them."""
+    template_dir = Path(apps.get_app_config('portfolio').path) / 'templates'
+    count = 0
+    for path in sorted(template_dir.rglob('*.html')):
+        get_template(path.relative_to(template_dir).as_posix())
+        count += 1
+    return count
+
+
+def main_pages():
+    """Yield (name, template, context builder) for every page worth pre-rendering."""
+    from . import views
+    from .models import Project
+
+    yield 'home', 'portfolio/home.html', views.home_context
+    yield 'projects', 'portfolio/projects.html', views.projects_context
+    yield 'gallery', 'portfolio/gallery.html', views.gallery_context
+    yield 'about:1', 'portfolio/about.html', views.about_context
+    for pk in Project.objects.values_list('pk', flat=True):
+        yield f'project_detail:{pk}', 'portfolio/project_detail.html', (lambda pk=pk: views.project_detail_context(pk))
+
+
+def warm_up():
+    """Preload templates and pre-render the main pages into the page cache."""
+    from .cache import get_compressed, get_page
+    from .sitemap import build_sitemap
+
+    started = time.perf_counter()
+    errors = 0
+    pages = 0
+    templates = 0
+    try:
+        templates = preload_templates()
+        for name, template_name, build_context in main_pages():
+            try:
+                get_page(name, template_name, build_context)
+                pages += 1
+            except Exception:
+                errors += 1
+                logger.exception('Warm-up failed for page %s', name)
+        get_compressed('sitemap', build_sitemap)
+    except Exception:
+        errors += 1
+        logger.exception('Warm-up failed')
+    finally:
+        # Connections are per thread and must not be shared with forked
+        # workers; close the ones this warm-up opened
+        connections.close_all()
+
+    _state.update(
+        templates=templates,
+        pages=pages,
+        errors=errors,
+        seconds=round(time.perf_counter() - started, 4),
+    )
+    mark_ready()
+    logger.info('Warm-up finished: %(templates)s templates, %(pages)s pages, %(errors)s errors in %(seconds)ss', _state)
+    return get_stats()
+
+
+def start():
+    """Run warm_up() in a background thread; /readyz returns 503 until it finishes."""
+    thread = threading.Thread(target=warm_up, name='portfolio-warmup', daemon=True)
+    thread.start()
+    return thread
+
+
+def start_on_boot():
+    """Called by core/wsgi.py and core/asgi.py once the application is loaded."""
+    mode = os.environ.get('PORTFOLIO_WARMUP', '1')
+    if mode == '0':
+        mark_ready()
+    elif mode != 'preload':
+        start()